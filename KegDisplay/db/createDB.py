@@ -11,8 +11,16 @@ Create a new database for the KeyDisplay system.
 import sqlite3
 con = sqlite3.connect('beer.db')
 cur = con.cursor()
-cur.execute(    
+
+# WAL is stored in the database file so the display can keep polling while
+# the beer list is being edited without either side blocking the other
+cur.execute("PRAGMA journal_mode=WAL")
+# Build the schema and seed rows in one transaction so the database is
+# either fully created or left untouched
+cur.executescript(
   '''
+  BEGIN;
+
   CREATE TABLE if not exists beers (
     'idBeer' integer primary key,
     'Name' tinytext NOT NULL,
@@ -26,33 +34,25 @@ cur.execute(
     'Kegged' datetime DEFAULT NULL,
     'Tapped' datetime DEFAULT NULL,
     'Notes' text DEFAULT NULL
-  )
-  '''  
-)
+  );
 
-cur.execute(    
-  '''
   CREATE TABLE if not exists taps (
     'idTap' integer primary key,
     'idBeer' integer
-  )
-  '''  
+  );
+  '''
 )
 
-cur.execute(
-    '''
-    INSERT INTO beers (Name, ABV, Description) VALUES 
-      ('Porter', 6.4, 'A standard porter from the land of porters'), 
-      ('Golden Ale', 4.5, 'Like sunshine in a bottle.  Enjoy while it lasts')
-    '''
-)
+beers = [
+    ('Porter', 6.4, 'A standard porter from the land of porters'),
+    ('Golden Ale', 4.5, 'Like sunshine in a bottle.  Enjoy while it lasts'),
+]
+cur.executemany("INSERT INTO beers (Name, ABV, Description) VALUES (?, ?, ?)", beers)
 
-cur.execute(
-    '''
-    INSERT INTO taps (idTap, idBeer) VALUES 
-      (1, 1),
-      (2, 2)
-    '''
-)
+taps = [
+    (1, 1),
+    (2, 2),
+]
+cur.executemany("INSERT INTO taps (idTap, idBeer) VALUES (?, ?)", taps)
 con.commit()
 con.close()
@@ -27,11 +27,11 @@ def csv_to_sqlite(csv_file_path, db_name, table_name):
         placeholders = ', '.join(['?'] * len(columns))
         insert_sql = f'INSERT INTO {table_name} ({", ".join(columns)}) VALUES ({placeholders})'
 
-        # Insert the data into the SQLite3 database
-        for row in csv_reader:
-            values = [row[column] for column in columns]
-            print (insert_sql, values)
-            cursor.execute(insert_sql, values)
+        # Insert the data into the SQLite3 database, preparing the statement once
+        # and streaming the rows into it
+        rows = ([row[column] for column in columns] for row in csv_reader)
+        cursor.executemany(insert_sql, rows)
+        print (f"Inserted {cursor.rowcount} rows into {table_name} using {insert_sql}")
 
     # Commit the transaction and close the connection
     conn.commit()
@@ -11,21 +11,26 @@ Main class for taggstaps program
 import signal
 import logging
 import sys
-import os
 import time
+import threading
 from pathlib import Path
 
 from pyAttention.source import database
-from tinyDisplay.render.collection import canvas, sequence
-from tinyDisplay.render.widget import text
-from tinyDisplay.utility import dataset, image2Text
-from tinyDisplay.cfg import _tdLoader, load
+from tinyDisplay.utility import dataset
+from tinyDisplay.cfg import load
 from tinyDisplay.utility import animate
 from luma.core.interface.parallel import bitbang_6800
 from luma.oled.device import ws0010
 
+# Set to request an orderly shutdown of the main loop
+exitEvent = threading.Event()
+
+# Interval between dataset refreshes from the database source
+UPDATE_INTERVAL = 0.1
+
+
 def sigterm_handler(_signo, _stack_frame):
-    sys.exit(0)
+    exitEvent.set()
 
 
 def start():
@@ -36,7 +41,11 @@ def start():
     #            sys.stdout = codecs.getwriter(u'utf-8')(sys.stdout, u'strict')
 
     logging.basicConfig(format=u'%(asctime)s:%(levelname)s:%(message)s', filename="/var/log/KegDisplay/taggstaps.log", level=logging.INFO)
-    logging.getLogger().addHandler(logging.StreamHandler())
+    # basicConfig is a no-op once configured but addHandler is not, so avoid
+    # echoing every record twice if start is entered more than once
+    rootLogger = logging.getLogger()
+    if not any(type(h) is logging.StreamHandler for h in rootLogger.handlers):
+        rootLogger.addHandler(logging.StreamHandler())
     logging.getLogger(u'socketIO-client').setLevel(logging.WARNING)
 
     # Move unhandled exception messages to log file
@@ -81,39 +90,62 @@ def start():
     interface = bitbang_6800(RS=24, E=25, PINS=[16,26,20,21])
     screen = ws0010(interface)
 
+    lastFrame = None
+
     def render(device, display):
+        nonlocal lastFrame
         display.render()
-        device.display(display.image.convert("1"))
+        img = display.image
+        if img.mode != "1":
+            img = img.convert("1")
+
+        # Only push the frame to the device when its pixels have changed
+        frame = img.tobytes()
+        if frame != lastFrame:
+            device.display(img)
+            lastFrame = frame
         return 1
 
     def updateData(dbSrc, ds):
+        # Drain everything that is waiting and apply it as one update per
+        # database so the dataset is only changed once per call
+        beers = {}
+        taps = {}
         while True:
             dbRow = dbSrc.get(0.001)
-            if dbRow is not None:
-                for key, value in dbRow.items():
-                    if key == 'beer':
-                        for item in value:
-                            if 'idBeer' in item:
-                                ds.update("beers", { item['idBeer']: {k: v for k, v in item.items() if k != 'idBeer'}}, merge=True)
-                    if key == 'taps':
-                        for item in value:
-                            if 'idTap' in item:
-                                    ds.update("taps", { item['idTap']: item['idBeer']}, merge=True)
-            else:
+            if dbRow is None:
                 break
+            for key, value in dbRow.items():
+                if key == 'beer':
+                    for item in value:
+                        # Rows are fresh dicts from the source so the key
+                        # can be removed in place instead of copying the row
+                        idBeer = item.pop('idBeer', None)
+                        if idBeer is not None:
+                            beers[idBeer] = item
+                if key == 'taps':
+                    for item in value:
+                        if 'idTap' in item:
+                            taps[item['idTap']] = item['idBeer']
+
+        if beers:
+            ds.update("beers", beers, merge=True)
+        if taps:
+            ds.update("taps", taps, merge=True)
     
     updateData(src, main._dataset)
     main.render()
 
     a = animate(render, 60, 500, screen, main)
     a.start()
-    startTime = time.time()
+    startTime = time.monotonic()
     try:
-        while True:
+        while not exitEvent.is_set():
             updateData(src, main._dataset)
-            if main._dataset.sys['status'] == 'start' and time.time() - startTime > 4:
+            if main._dataset.sys['status'] == 'start' and time.monotonic() - startTime > 4:
                 main._dataset.update('sys', {'status': 'running'}, merge=True)
-            a.clear()    
+            a.clear()
+            exitEvent.wait(UPDATE_INTERVAL)
 
     except KeyboardInterrupt:
         pass